@@ -0,0 +1,46 @@
+"""Shared boto3 session and client factory.
+
+Building a boto3 Session loads AWS config files and may probe instance
+metadata, which is surprisingly slow (tens of milliseconds); clients
+additionally carry their own HTTP connection pools and TLS sessions.
+Caching them by (region, credentials) lets repeat construction — e.g.
+per CLI invocation or per request in a server loop — reuse connections
+and credential refreshers instead of rebuilding them.
+"""
+import functools
+from typing import Optional
+import boto3
+from botocore.config import Config
+
+@functools.lru_cache(maxsize=None)
+def get_session(
+    region_name: str,
+    access_key: Optional[str] = None,
+    secret_key: Optional[str] = None
+) -> boto3.Session:
+    """Return a cached boto3 Session for the given region and credentials."""
+    session_kwargs = {"region_name": region_name}
+    if access_key or secret_key:
+        session_kwargs.update({
+            "aws_access_key_id": access_key,
+            "aws_secret_access_key": secret_key
+        })
+    return boto3.Session(**session_kwargs)
+
+@functools.lru_cache(maxsize=None)
+def get_client(
+    service_name: str,
+    region_name: str,
+    access_key: Optional[str] = None,
+    secret_key: Optional[str] = None,
+    max_pool_connections: int = 64
+):
+    """Return a cached boto3 client with a pooled, adaptive-retry config."""
+    session = get_session(region_name, access_key, secret_key)
+    return session.client(
+        service_name,
+        config=Config(
+            max_pool_connections=max_pool_connections,
+            retries={"mode": "adaptive"}
+        )
+    )
@@ -0,0 +1,65 @@
+"""Numerical kernels for metric score aggregation.
+
+The reductions are JIT-compiled with numba when it is installed and fall
+back to NumPy implementations with identical signatures otherwise. The
+jitted kernels are warmed up at import time so compilation cost never
+lands in user-visible latency.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def mean_std(scores):
+        """Return (mean, standard deviation) of a float64 score array."""
+        n = scores.size
+        if n == 0:
+            return 0.0, 0.0
+
+        total = 0.0
+        for i in range(n):
+            total += scores[i]
+        mean = total / n
+
+        sq_dev = 0.0
+        for i in range(n):
+            diff = scores[i] - mean
+            sq_dev += diff * diff
+
+        return mean, np.sqrt(sq_dev / n)
+
+    @njit(cache=True)
+    def bootstrap_mean(scores, n_resamples, seed):
+        """Return bootstrap-resampled means for confidence estimation."""
+        np.random.seed(seed)
+        n = scores.size
+        means = np.empty(n_resamples, dtype=np.float64)
+
+        for b in range(n_resamples):
+            total = 0.0
+            for _ in range(n):
+                total += scores[np.random.randint(0, n)]
+            means[b] = total / n
+
+        return means
+
+    # Warm up the JIT on a tiny array so the first real call is fast.
+    _warmup = np.zeros(1, dtype=np.float64)
+    mean_std(_warmup)
+    bootstrap_mean(_warmup, 1, 0)
+else:
+    def mean_std(scores):
+        """Return (mean, standard deviation) of a float64 score array."""
+        if scores.size == 0:
+            return 0.0, 0.0
+        return float(np.mean(scores)), float(np.std(scores))
+
+    def bootstrap_mean(scores, n_resamples, seed):
+        """Return bootstrap-resampled means for confidence estimation."""
+        rng = np.random.RandomState(seed)
+        indices = rng.randint(0, scores.size, size=(n_resamples, scores.size))
+        return scores[indices].mean(axis=1)
@@ -0,0 +1,105 @@
+"""Adaptive concurrency control for parallel model calls.
+
+A fixed semaphore either wastes throughput below the provider's rate
+limit or trips 429s above it. AdaptiveLimiter combines a sliding-window
+requests-per-minute cap with an AIMD (additive-increase,
+multiplicative-decrease) concurrency controller: throttling errors halve
+the number of in-flight calls, and a run of consecutive successes grows
+it back one permit at a time, so throughput settles just under the
+provider's limit without hand-tuning.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+class AdaptiveLimiter:
+    """Async context manager gating concurrent, rate-limited model calls."""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rpm: Optional[int] = None,
+        increase_after: int = 10
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency: Ceiling on concurrent in-flight calls
+            rpm: Optional requests-per-minute cap (None for unlimited)
+            increase_after: Consecutive successes before widening by one
+        """
+        self.max_concurrency = max_concurrency
+        self.rpm = rpm
+        self._limit = max_concurrency
+        self._debt = 0
+        self._successes = 0
+        self._increase_after = increase_after
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._request_times = deque()
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        if self.rpm is not None:
+            await self._wait_for_rpm_slot()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Permits removed by a backoff are absorbed here instead of being
+        # released, shrinking the pool without revoking in-flight calls.
+        if self._debt > 0:
+            self._debt -= 1
+        else:
+            self._semaphore.release()
+        return False
+
+    async def _wait_for_rpm_slot(self):
+        """Block until issuing a request would stay under the RPM cap."""
+        while True:
+            now = time.monotonic()
+            while self._request_times and now - self._request_times[0] >= 60.0:
+                self._request_times.popleft()
+            if len(self._request_times) < self.rpm:
+                self._request_times.append(now)
+                return
+            await asyncio.sleep(60.0 - (now - self._request_times[0]))
+
+    def on_success(self):
+        """Record a successful call; widen after a run of successes."""
+        self._successes += 1
+        if (self._successes >= self._increase_after
+                and self._limit < self.max_concurrency):
+            self._successes = 0
+            self._limit += 1
+            if self._debt > 0:
+                self._debt -= 1
+            else:
+                self._semaphore.release()
+
+    def on_rate_limit(self):
+        """Record a throttling error; halve the concurrency limit."""
+        self._successes = 0
+        target = max(1, self._limit // 2)
+        self._debt += self._limit - target
+        self._limit = target
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Return whether an exception looks like provider throttling.
+
+    Matched structurally so openai's RateLimitError, botocore's
+    ThrottlingException and plain HTTP 429 responses are all recognized
+    without importing any provider SDK here.
+    """
+    name = type(exc).__name__
+    if "RateLimit" in name or "Throttling" in name or "TooManyRequests" in name:
+        return True
+    status = getattr(exc, "status_code", None)
+    if status == 429:
+        return True
+    response = getattr(exc, "response", None)
+    if isinstance(response, dict):
+        code = response.get("Error", {}).get("Code", "")
+        return code in ("ThrottlingException", "TooManyRequestsException")
+    return False
@@ -0,0 +1,44 @@
+"""Metric instruments for cache effectiveness and API latency.
+
+Backed by OpenTelemetry when it is installed; otherwise the instruments
+are no-ops, so call sites can record unconditionally. The counters exist
+to make the caching and batching optimizations measurable — hit ratios
+and latency histograms are what turn concurrency and cache tuning from
+guesswork into arithmetic.
+"""
+
+try:
+    from opentelemetry import metrics as _otel_metrics
+
+    _meter = _otel_metrics.get_meter("genai_validator")
+    api_calls = _meter.create_counter(
+        "llm_api_calls",
+        description="Number of LLM API operations issued"
+    )
+    api_latency = _meter.create_histogram(
+        "llm_api_latency_ms",
+        unit="ms",
+        description="Latency of LLM-backed operations"
+    )
+    cache_hits = _meter.create_counter(
+        "cache_hits",
+        description="Cache lookups served without an API call"
+    )
+    cache_misses = _meter.create_counter(
+        "cache_misses",
+        description="Cache lookups that fell through to an API call"
+    )
+except ImportError:
+    class _NoopInstrument:
+        """Accepts counter/histogram calls and discards them."""
+
+        def add(self, amount, attributes=None):
+            pass
+
+        def record(self, amount, attributes=None):
+            pass
+
+    api_calls = _NoopInstrument()
+    api_latency = _NoopInstrument()
+    cache_hits = _NoopInstrument()
+    cache_misses = _NoopInstrument()
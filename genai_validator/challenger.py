@@ -1,42 +1,80 @@
+from types import MappingProxyType
 from typing import Dict, Optional
 from .models.base import BaseModel
 from .models.azure import AzureOpenAIModel
 from .models.bedrock import BedrockModel
 
+# Mapping of task types to recommended models and their benchmarks.
+# Built once at module load and shared (read-only) by all selector
+# instances instead of being reallocated per ChallengerSelector.
+_TASK_MODELS = MappingProxyType({
+    "qa": {
+        "model": "gpt-4",
+        "provider": "azure",
+        "benchmark_score": 0.92,
+        "benchmark_name": "SQuAD 2.0"
+    },
+    "summarization": {
+        "model": "anthropic.claude-v2",
+        "provider": "bedrock",
+        "benchmark_score": 0.89,
+        "benchmark_name": "ROUGE-L on CNN/DailyMail"
+    },
+    "reasoning": {
+        "model": "gpt-4",
+        "provider": "azure",
+        "benchmark_score": 0.90,
+        "benchmark_name": "GSM8K"
+    }
+})
+
+def _make_azure(model_info: Dict, credentials: Optional[Dict[str, str]]) -> BaseModel:
+    """Build the Azure challenger for a task entry."""
+    if not credentials:
+        raise ValueError(
+            "Azure credentials required for the selected challenger model"
+        )
+
+    return AzureOpenAIModel(
+        deployment_name=model_info["model"],
+        api_key=credentials["api_key"],
+        api_base=credentials["api_base"],
+        api_version=credentials.get("api_version", "2024-02-15-preview")
+    )
+
+def _make_bedrock(model_info: Dict, credentials: Optional[Dict[str, str]]) -> BaseModel:
+    """Build the Bedrock challenger for a task entry."""
+    if not credentials:
+        raise ValueError(
+            "AWS credentials required for the selected challenger model"
+        )
+
+    return BedrockModel(
+        model_id=model_info["model"],
+        credentials=credentials
+    )
+
+# Provider dispatch table: get_best_model resolves the factory with one
+# dict lookup instead of an if/elif chain over provider strings.
+_PROVIDER_FACTORIES = MappingProxyType({
+    "azure": _make_azure,
+    "bedrock": _make_bedrock
+})
+
 class ChallengerSelector:
     """Selector for challenger models based on task type."""
-    
+
+    task_models = _TASK_MODELS
+
     def __init__(self, task_type: str):
         """
         Initialize challenger selector.
-        
+
         Args:
             task_type: Type of task ("qa", "summarization", "reasoning")
         """
         self.task_type = task_type.lower()
-        
-        # Mapping of task types to recommended models and their benchmarks
-        self.task_models = {
-            "qa": {
-                "model": "gpt-4",
-                "provider": "azure",
-                "benchmark_score": 0.92,
-                "benchmark_name": "SQuAD 2.0"
-            },
-            "summarization": {
-                "model": "anthropic.claude-v2",
-                "provider": "bedrock",
-                "benchmark_score": 0.89,
-                "benchmark_name": "ROUGE-L on CNN/DailyMail"
-            },
-            "reasoning": {
-                "model": "gpt-4",
-                "provider": "azure",
-                "benchmark_score": 0.90,
-                "benchmark_name": "GSM8K"
-            }
-        }
-    
+
     def get_best_model(
         self,
         azure_credentials: Optional[Dict[str, str]] = None,
@@ -52,41 +90,25 @@ class ChallengerSelector:
         Returns:
             Instance of the best model for the task
         """
-        if self.task_type not in self.task_models:
+        if self.task_type not in _TASK_MODELS:
             raise ValueError(
                 f"Unknown task type: {self.task_type}. "
-                f"Available tasks: {list(self.task_models.keys())}"
+                f"Available tasks: {list(_TASK_MODELS.keys())}"
             )
         
-        model_info = self.task_models[self.task_type]
+        model_info = _TASK_MODELS[self.task_type]
         provider = model_info["provider"]
-        
-        if provider == "azure":
-            if not azure_credentials:
-                raise ValueError(
-                    "Azure credentials required for the selected challenger model"
-                )
-            
-            return AzureOpenAIModel(
-                deployment_name=model_info["model"],
-                api_key=azure_credentials["api_key"],
-                api_base=azure_credentials["api_base"],
-                api_version=azure_credentials.get("api_version", "2024-02-15-preview")
-            )
-        
-        elif provider == "bedrock":
-            if not bedrock_credentials:
-                raise ValueError(
-                    "AWS credentials required for the selected challenger model"
-                )
-            
-            return BedrockModel(
-                model_id=model_info["model"],
-                credentials=bedrock_credentials
-            )
-        
-        else:
+
+        factory = _PROVIDER_FACTORIES.get(provider)
+        if factory is None:
             raise ValueError(f"Unknown provider: {provider}")
+
+        credentials = {
+            "azure": azure_credentials,
+            "bedrock": bedrock_credentials
+        }[provider]
+
+        return factory(model_info, credentials)
     
     def get_benchmark_info(self) -> Dict[str, str]:
         """
@@ -95,13 +117,13 @@ class ChallengerSelector:
         Returns:
             Dictionary containing benchmark information
         """
-        if self.task_type not in self.task_models:
+        if self.task_type not in _TASK_MODELS:
             raise ValueError(
                 f"Unknown task type: {self.task_type}. "
-                f"Available tasks: {list(self.task_models.keys())}"
+                f"Available tasks: {list(_TASK_MODELS.keys())}"
             )
         
-        model_info = self.task_models[self.task_type]
+        model_info = _TASK_MODELS[self.task_type]
         return {
             "model": model_info["model"],
             "provider": model_info["provider"],
@@ -1,6 +1,13 @@
 import click
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 from .validator import ModelValidator
 from .data import S3DataExtractor
 from .models import BedrockModel, AzureOpenAIModel
@@ -27,19 +34,21 @@ def cli():
               help='Path to JSON file containing Azure credentials (if needed)')
 @click.option('--metrics', default='faithfulness,context_utilization,answer_relevancy',
               help='Comma-separated list of metrics to evaluate')
+@click.option('--json', 'as_json', is_flag=True,
+              help='Emit results as JSON instead of the markdown report')
 def validate(task_type: str, original_model_provider: str, original_model_id: str,
             s3_bucket: str, s3_prefix: str, aws_credentials_file: str,
-            azure_credentials_file: str, metrics: str):
+            azure_credentials_file: str, metrics: str, as_json: bool):
     """Run validation comparing original model against a challenger."""
     
     # Load credentials
-    with open(aws_credentials_file) as f:
-        aws_credentials = json.load(f)
-    
+    with open(aws_credentials_file, "rb") as f:
+        aws_credentials = _json_loads(f.read())
+
     azure_credentials = None
     if azure_credentials_file:
-        with open(azure_credentials_file) as f:
-            azure_credentials = json.load(f)
+        with open(azure_credentials_file, "rb") as f:
+            azure_credentials = _json_loads(f.read())
     
     # Initialize data extractor
     data_extractor = S3DataExtractor(
@@ -47,30 +56,36 @@ def validate(task_type: str, original_model_provider: str, original_model_id: st
         prefix=s3_prefix,
         credentials=aws_credentials
     )
-    
-    # Initialize original model
-    if original_model_provider == 'bedrock':
-        original_model = BedrockModel(
-            model_id=original_model_id,
-            credentials=aws_credentials
-        )
-    else:  # azure
-        if not azure_credentials:
-            raise click.UsageError("Azure credentials required for Azure model")
-        original_model = AzureOpenAIModel(
-            deployment_name=original_model_id,
-            **azure_credentials
+
+    # Data extraction is independent of model construction, so start the
+    # S3 downloads in the background and build the clients while they run.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        click.echo("Extracting development data...")
+        extract_future = executor.submit(data_extractor.extract)
+
+        # Initialize original model
+        if original_model_provider == 'bedrock':
+            model_future = executor.submit(
+                BedrockModel,
+                model_id=original_model_id,
+                credentials=aws_credentials
+            )
+        else:  # azure
+            if not azure_credentials:
+                raise click.UsageError("Azure credentials required for Azure model")
+            model_future = executor.submit(
+                AzureOpenAIModel,
+                deployment_name=original_model_id,
+                **azure_credentials
+            )
+
+        # Create validator
+        validator = ModelValidator(
+            original_model=model_future.result(),
+            task_type=task_type
         )
-    
-    # Create validator
-    validator = ModelValidator(
-        original_model=original_model,
-        task_type=task_type
-    )
-    
-    # Extract development data
-    click.echo("Extracting development data...")
-    development_data = data_extractor.extract()
+
+        development_data = extract_future.result()
     
     # Parse metrics
     metrics_list = [m.strip() for m in metrics.split(',')]
@@ -83,8 +98,11 @@ def validate(task_type: str, original_model_provider: str, original_model_id: st
     )
     
     # Print results
-    click.echo("\nValidation Results:")
-    click.echo(results.generate_report())
+    if as_json:
+        click.echo(results.to_json().decode("utf-8"))
+    else:
+        click.echo("\nValidation Results:")
+        click.echo(results.generate_report())
 
 if __name__ == '__main__':
     cli() 
\ No newline at end of file
@@ -1,7 +1,44 @@
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 import json
-import boto3
+import logging
+import queue
 from botocore.exceptions import ClientError
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from ._aws import get_client, get_session
+
+logger = logging.getLogger(__name__)
+
+class DevelopmentItem(BaseModel):
+    """Required shape of one development-data record."""
+    context: str
+    question: str
+    answer: str
+
+# Validating through a TypeAdapter runs in pydantic's compiled core —
+# roughly an order of magnitude faster than per-field Python checks.
+_ITEM_LIST_ADAPTER = TypeAdapter(List[DevelopmentItem])
+
+try:
+    # orjson parses bytes directly and is several times faster than stdlib
+    # json, which matters for large development corpora.
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # ijson lets large JSON arrays be parsed incrementally off the S3
+    # stream instead of buffering the whole object first.
+    import ijson
+except ImportError:
+    ijson = None
+
+# Objects at or above this size are fetched with concurrent byte-range GETs
+# instead of a single stream; 8 MiB parts are the typical S3 sweet spot.
+RANGE_FETCH_THRESHOLD = 8 * 1024 * 1024
+RANGE_FETCH_PART_SIZE = 8 * 1024 * 1024
+RANGE_FETCH_WORKERS = 8
 
 class S3DataExtractor:
     def __init__(
@@ -9,41 +46,123 @@ class S3DataExtractor:
         bucket_name: str,
         prefix: str = "",
         region_name: str = "us-east-1",
-        credentials: Optional[Dict[str, str]] = None
+        credentials: Optional[Dict[str, str]] = None,
+        max_workers: int = 32
     ):
         """
         Initialize S3 data extractor.
-        
+
         Args:
             bucket_name: Name of the S3 bucket
             prefix: Prefix for S3 objects (folder path)
             region_name: AWS region name
             credentials: AWS credentials (access key, secret key)
+            max_workers: Number of threads used to download objects in parallel
         """
         self.bucket_name = bucket_name
         self.prefix = prefix
-        
-        session_kwargs = {"region_name": region_name}
-        if credentials:
-            session_kwargs.update({
-                "aws_access_key_id": credentials.get("access_key"),
-                "aws_secret_access_key": credentials.get("secret_key")
-            })
-        
-        self.session = boto3.Session(**session_kwargs)
-        self.s3_client = self.session.client("s3")
+        self.max_workers = max_workers
+
+        credentials = credentials or {}
+        self.session = get_session(
+            region_name,
+            credentials.get("access_key"),
+            credentials.get("secret_key")
+        )
+        # Size the connection pool above the worker count so parallel
+        # downloads are not serialized by urllib3.
+        self.s3_client = get_client(
+            "s3",
+            region_name,
+            credentials.get("access_key"),
+            credentials.get("secret_key"),
+            max_pool_connections=max(64, 2 * max_workers)
+        )
     
-    def _read_json_file(self, key: str) -> Dict[str, Any]:
-        """Read and parse a JSON file from S3."""
-        try:
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=key
+    def _get_range(self, key: str, start: int, end: int) -> bytes:
+        """Fetch a single byte range of an S3 object."""
+        response = self.s3_client.get_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Range=f"bytes={start}-{end}"
+        )
+        return response["Body"].read()
+
+    def _read_ranged(self, key: str, size: int) -> bytes:
+        """
+        Read a large object with concurrent byte-range GETs.
+
+        A single GET is bottlenecked by one TCP stream's bandwidth-delay
+        product; splitting the object into parts fetched in parallel
+        multiplies effective throughput.
+        """
+        ranges = [
+            (start, min(start + RANGE_FETCH_PART_SIZE, size) - 1)
+            for start in range(0, size, RANGE_FETCH_PART_SIZE)
+        ]
+
+        buf = bytearray(size)
+        with ThreadPoolExecutor(max_workers=RANGE_FETCH_WORKERS) as executor:
+            chunks = executor.map(
+                lambda r: self._get_range(key, r[0], r[1]),
+                ranges
             )
-            content = response["Body"].read().decode("utf-8")
-            return json.loads(content)
+            for (start, _), chunk in zip(ranges, chunks):
+                buf[start:start + len(chunk)] = chunk
+
+        return bytes(buf)
+
+    def _read_jsonl(self, key: str) -> List[Dict[str, Any]]:
+        """Read a JSON Lines object one record at a time."""
+        response = self.s3_client.get_object(
+            Bucket=self.bucket_name,
+            Key=key
+        )
+        return [
+            _json_loads(line)
+            for line in response["Body"].iter_lines()
+            if line
+        ]
+
+    def _read_json_file(self, key: str, size: Optional[int] = None) -> Dict[str, Any]:
+        """Read and parse a JSON (or JSON Lines) file from S3.
+
+        Args:
+            key: Object key to read
+            size: Object size in bytes when already known (e.g. from the
+                listing); passing it avoids a HEAD round trip per object
+        """
+        try:
+            if key.endswith(".jsonl"):
+                return self._read_jsonl(key)
+
+            if size is None:
+                head = self.s3_client.head_object(
+                    Bucket=self.bucket_name,
+                    Key=key
+                )
+                size = head["ContentLength"]
+
+            if size < RANGE_FETCH_THRESHOLD:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=key
+                )
+                return _json_loads(response["Body"].read())
+
+            # For large arrays, parse incrementally off the stream so peak
+            # memory stays O(record) instead of 2x the object size. A one
+            # byte ranged GET tells us whether the top level is an array.
+            if ijson is not None and self._get_range(key, 0, 0) == b"[":
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=key
+                )
+                return list(ijson.items(response["Body"], "item"))
+
+            return _json_loads(self._read_ranged(key, size))
         except ClientError as e:
-            print(f"Error reading file {key}: {str(e)}")
+            logger.warning("Error reading file %s: %s", key, e)
             return {}
     
     def extract(self) -> List[Dict[str, Any]]:
@@ -53,38 +172,85 @@ class S3DataExtractor:
         Returns:
             List of dictionaries containing the development data
         """
+        # Listing and downloading are fused into a producer-consumer
+        # pipeline: one thread streams keys out of the paginator while the
+        # worker pool downloads them, so the first GETs start as soon as
+        # the first page arrives instead of after the full listing.
+        key_queue = queue.Queue(maxsize=256)
+        result_queue = queue.Queue()
+        done = object()
+
+        def produce_keys():
+            # Keys are tagged with their listing index so results can be
+            # reassembled in listing order regardless of which download
+            # finishes first.
+            index = 0
+            try:
+                paginator = self.s3_client.get_paginator("list_objects_v2")
+                page_iterator = paginator.paginate(
+                    Bucket=self.bucket_name,
+                    Prefix=self.prefix
+                )
+
+                for page in page_iterator:
+                    for obj in page.get("Contents", []):
+                        key = obj["Key"]
+
+                        # Only process JSON and JSON Lines files
+                        if key.endswith((".json", ".jsonl")):
+                            key_queue.put((index, key, obj["Size"]))
+                            index += 1
+            except ClientError as e:
+                logger.warning("Error listing objects in bucket: %s", e)
+            finally:
+                # One sentinel per worker terminates the pool.
+                for _ in range(self.max_workers):
+                    key_queue.put(done)
+
+        def download_keys():
+            # The sentinel is emitted in a finally and per-key failures are
+            # logged rather than raised: a worker that dies without its
+            # sentinel (or stops draining the bounded key_queue) would
+            # deadlock the main loop and the producer.
+            try:
+                while True:
+                    item = key_queue.get()
+                    if item is done:
+                        return
+                    index, key, size = item
+                    try:
+                        result_queue.put((index, self._read_json_file(key, size)))
+                    except Exception as e:
+                        logger.warning("Error reading file %s: %s", key, e)
+            finally:
+                result_queue.put(done)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers + 1) as executor:
+            executor.submit(produce_keys)
+            for _ in range(self.max_workers):
+                executor.submit(download_keys)
+
+            finished_workers = 0
+            while finished_workers < self.max_workers:
+                item = result_queue.get()
+                if item is done:
+                    finished_workers += 1
+                else:
+                    index, data = item
+                    results[index] = data
+
+        # Flatten in listing order so repeated extracts over unchanged data
+        # produce byte-identical output (downstream caches key on content).
         development_data = []
-        
-        try:
-            # List all objects in the bucket with the given prefix
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            page_iterator = paginator.paginate(
-                Bucket=self.bucket_name,
-                Prefix=self.prefix
-            )
-            
-            for page in page_iterator:
-                if "Contents" not in page:
-                    continue
-                
-                for obj in page["Contents"]:
-                    key = obj["Key"]
-                    
-                    # Only process JSON files
-                    if not key.endswith(".json"):
-                        continue
-                    
-                    data = self._read_json_file(key)
-                    
-                    # Handle both single items and lists of items
-                    if isinstance(data, list):
-                        development_data.extend(data)
-                    else:
-                        development_data.append(data)
-        
-        except ClientError as e:
-            print(f"Error listing objects in bucket: {str(e)}")
-        
+        for index in sorted(results):
+            data = results[index]
+            # Handle both single items and lists of items
+            if isinstance(data, list):
+                development_data.extend(data)
+            else:
+                development_data.append(data)
+
         return development_data
     
     def validate_data_format(self, data: List[Dict[str, Any]]) -> bool:
@@ -97,23 +263,9 @@ class S3DataExtractor:
         Returns:
             True if data format is valid, False otherwise
         """
-        required_fields = {"context", "question", "answer"}
-        
-        for item in data:
-            if not all(field in item for field in required_fields):
-                print(f"Missing required fields in item: {item}")
-                return False
-            
-            if not isinstance(item["context"], str):
-                print(f"Context must be a string in item: {item}")
-                return False
-                
-            if not isinstance(item["question"], str):
-                print(f"Question must be a string in item: {item}")
-                return False
-                
-            if not isinstance(item["answer"], str):
-                print(f"Answer must be a string in item: {item}")
-                return False
-        
-        return True 
\ No newline at end of file
+        try:
+            _ITEM_LIST_ADAPTER.validate_python(data)
+            return True
+        except ValidationError as e:
+            logger.debug("Invalid data format: %s", e)
+            return False 
\ No newline at end of file
@@ -1,117 +1,188 @@
-from typing import List, Dict, Any
-import ragas
-from ragas.metrics import (
-    answer_relevancy,
-    context_relevancy,
-    faithfulness,
-    context_recall
-)
+import asyncio
+import hashlib
+import json
+import logging
+import random
+from importlib import import_module
+from typing import List, Dict, Any, Optional, MutableMapping
+import numpy as np
 from .models.base import BaseModel
+from ._kernels import mean_std
+from ._limits import AdaptiveLimiter, is_rate_limit_error
+from ._telemetry import api_calls, cache_hits, cache_misses
+
+logger = logging.getLogger(__name__)
+
+# Version tag baked into score-cache keys so dependency upgrades that
+# change scoring invalidate previously cached results.
+METRICS_VERSION = "1"
 
 class MetricsCalculator:
     """Calculator for various evaluation metrics."""
-    
-    def __init__(self):
-        """Initialize metrics calculator with available metrics."""
+
+    def __init__(self, cache_backend: Optional[MutableMapping] = None):
+        """
+        Initialize metrics calculator with available metrics.
+
+        Args:
+            cache_backend: Mapping used to memoize per-row metric scores
+                by content hash (defaults to an in-process dict); any
+                dict-like store such as diskcache.Cache also works
+        """
+        # Metric name -> (ragas.metrics submodule, evaluator class).
+        # Kept as names so importing this package does not pull in ragas
+        # (and its langchain/datasets dependency tree) until a metric is
+        # actually scored.
         self.available_metrics = {
-            "faithfulness": self._calculate_faithfulness,
-            "context_utilization": self._calculate_context_utilization,
-            "answer_relevancy": self._calculate_answer_relevancy,
-            "context_recall": self._calculate_context_recall
+            "faithfulness": ("faithfulness", "Faithfulness"),
+            "context_utilization": ("context_relevancy", "ContextRelevancy"),
+            "answer_relevancy": ("answer_relevancy", "AnswerRelevancy"),
+            "context_recall": ("context_recall", "ContextRecall")
         }
-    
-    def _calculate_faithfulness(
-        self,
-        model: BaseModel,
-        test_data: List[Dict[str, Any]]
-    ) -> float:
-        """Calculate faithfulness score."""
-        evaluator = faithfulness.Faithfulness()
-        scores = []
-        
-        for item in test_data:
-            context = item["context"]
-            question = item["question"]
-            answer = model.generate_response(question, context)
-            
-            score = evaluator.score(
-                question=question,
-                answer=answer,
-                context=context
-            )
-            scores.append(score)
-        
-        return sum(scores) / len(scores) if scores else 0.0
-    
-    def _calculate_context_utilization(
-        self,
-        model: BaseModel,
-        test_data: List[Dict[str, Any]]
-    ) -> float:
-        """Calculate context utilization score."""
-        evaluator = context_relevancy.ContextRelevancy()
-        scores = []
-        
-        for item in test_data:
-            context = item["context"]
-            question = item["question"]
-            answer = model.generate_response(question, context)
-            
-            score = evaluator.score(
-                question=question,
-                answer=answer,
-                context=context
-            )
-            scores.append(score)
-        
-        return sum(scores) / len(scores) if scores else 0.0
-    
-    def _calculate_answer_relevancy(
-        self,
-        model: BaseModel,
-        test_data: List[Dict[str, Any]]
-    ) -> float:
-        """Calculate answer relevancy score."""
-        evaluator = answer_relevancy.AnswerRelevancy()
-        scores = []
-        
-        for item in test_data:
-            context = item["context"]
-            question = item["question"]
-            answer = model.generate_response(question, context)
-            
-            score = evaluator.score(
-                question=question,
-                answer=answer,
-                context=context
-            )
-            scores.append(score)
-        
-        return sum(scores) / len(scores) if scores else 0.0
-    
-    def _calculate_context_recall(
+        self._evaluators = {}
+        self._score_cache = cache_backend if cache_backend is not None else {}
+
+    @staticmethod
+    def _score_key(metric: str, question: str, answer: str, context: str) -> str:
+        """Content hash identifying one (metric, row) scoring result."""
+        payload = json.dumps(
+            {
+                "version": METRICS_VERSION,
+                "metric": metric,
+                "question": question,
+                "answer": answer,
+                "context": context
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_evaluator(self, metric: str):
+        """Return the evaluator for a metric, constructing it on first use.
+
+        Evaluator setup (LLM client creation, prompt-template compilation)
+        is paid once per calculator instead of once per calculate_metrics
+        call; rarely used metrics are never constructed at all.
+        """
+        if metric not in self._evaluators:
+            module_name, class_name = self.available_metrics[metric]
+            module = import_module(f"ragas.metrics.{module_name}")
+            self._evaluators[metric] = getattr(module, class_name)()
+        return self._evaluators[metric]
+
+    @staticmethod
+    def _deduplicate(questions: List[str], contexts: List[str]):
+        """Collapse duplicate (context, question) pairs before generation.
+
+        Web-scraped QA sets commonly repeat rows; generating once per
+        unique pair and scattering the answers back avoids redundant LLM
+        calls. Returns the unique columns plus the inverse mapping.
+        """
+        index_by_pair = {}
+        unique_questions = []
+        unique_contexts = []
+        inverse = []
+
+        for question, context in zip(questions, contexts):
+            pair = (context, question)
+            index = index_by_pair.get(pair)
+            if index is None:
+                index = len(unique_questions)
+                index_by_pair[pair] = index
+                unique_questions.append(question)
+                unique_contexts.append(context)
+            inverse.append(index)
+
+        return unique_questions, unique_contexts, inverse
+
+    def _select_metrics(self, metrics: List[str]) -> List[str]:
+        """Filter the requested metric names down to the known ones."""
+        if metrics is None:
+            return list(self.available_metrics.keys())
+
+        selected = []
+        for metric in metrics:
+            if metric not in self.available_metrics:
+                logger.warning("Unknown metric '%s', skipping...", metric)
+                continue
+            selected.append(metric)
+        return selected
+
+    def _score_answers(
         self,
-        model: BaseModel,
-        test_data: List[Dict[str, Any]]
-    ) -> float:
-        """Calculate context recall score."""
-        evaluator = context_recall.ContextRecall()
-        scores = []
-        
-        for item in test_data:
-            context = item["context"]
-            question = item["question"]
-            answer = model.generate_response(question, context)
-            
-            score = evaluator.score(
-                question=question,
-                answer=answer,
-                context=context
-            )
-            scores.append(score)
-        
-        return sum(scores) / len(scores) if scores else 0.0
-    
+        selected: List[str],
+        questions: List[str],
+        answers: List[str],
+        contexts: List[str]
+    ) -> Dict[str, float]:
+        """Score generated answers with every selected metric.
+
+        Per-row results are memoized in the score cache by content hash,
+        so re-validating the same rows — within a run or across runs when
+        a persistent backend is injected — skips the metric's own LLM
+        judge calls entirely.
+        """
+        scores = {}
+        for metric in selected:
+            evaluator = self._get_evaluator(metric)
+
+            values = np.empty(len(questions), dtype=np.float64)
+            # Uncached rows are collapsed by cache key before judging, so
+            # duplicate (question, answer, context) rows cost one judge
+            # call even on a cold cache; positions_by_key fans the single
+            # score back out to every duplicate.
+            positions_by_key = {}
+            missing = []
+            for i, (question, answer, context) in enumerate(
+                zip(questions, answers, contexts)
+            ):
+                key = self._score_key(metric, question, answer, context)
+                cached = self._score_cache.get(key)
+                if cached is not None:
+                    cache_hits.add(1, {"cache": "score"})
+                    values[i] = cached
+                    continue
+                positions = positions_by_key.get(key)
+                if positions is None:
+                    cache_misses.add(1, {"cache": "score"})
+                    positions_by_key[key] = [i]
+                    missing.append((i, key))
+                else:
+                    cache_hits.add(1, {"cache": "score"})
+                    positions.append(i)
+
+            if missing and hasattr(evaluator, "score_batch"):
+                # Score the uncached rows in one evaluator pipeline so
+                # ragas can batch its judge calls internally; its batch
+                # APIs expect one list of contexts per sample.
+                batch_scores = evaluator.score_batch(
+                    questions=[questions[i] for i, _ in missing],
+                    answers=[answers[i] for i, _ in missing],
+                    contexts=[[contexts[i]] for i, _ in missing]
+                )
+                for (i, key), score in zip(missing, batch_scores):
+                    score = float(score)
+                    for position in positions_by_key[key]:
+                        values[position] = score
+                    self._score_cache[key] = score
+            else:
+                for i, key in missing:
+                    score = float(evaluator.score(
+                        question=questions[i],
+                        answer=answers[i],
+                        context=contexts[i]
+                    ))
+                    for position in positions_by_key[key]:
+                        values[position] = score
+                    self._score_cache[key] = score
+
+            scores[metric] = values
+
+        return {
+            metric: float(mean_std(values)[0])
+            for metric, values in scores.items()
+        }
+
     def calculate_metrics(
         self,
         model: BaseModel,
@@ -120,26 +191,170 @@ class MetricsCalculator:
     ) -> Dict[str, float]:
         """
         Calculate specified metrics for the model on test data.
-        
+
+        Each answer is generated once and scored with every requested
+        metric, so the model is called N times instead of k*N for k
+        metrics — the LLM call dominates the cost of every metric.
+
         Args:
             model: Model to evaluate
             test_data: Test data to evaluate on
             metrics: List of metric names to calculate (defaults to all available metrics)
-            
+
         Returns:
             Dictionary mapping metric names to scores
         """
-        if metrics is None:
-            metrics = list(self.available_metrics.keys())
-        
-        results = {}
-        for metric in metrics:
-            if metric not in self.available_metrics:
-                print(f"Warning: Unknown metric '{metric}', skipping...")
-                continue
-            
-            calculator = self.available_metrics[metric]
-            score = calculator(model, test_data)
-            results[metric] = score
-        
-        return results 
\ No newline at end of file
+        selected = self._select_metrics(metrics)
+
+        # Struct-of-arrays layout: pull each column out of the row dicts
+        # once instead of re-doing the dict lookups in every metric loop.
+        contexts = [item["context"] for item in test_data]
+        questions = [item["question"] for item in test_data]
+
+        unique_questions, unique_contexts, inverse = self._deduplicate(
+            questions, contexts
+        )
+        unique_answers = model.batch_generate(unique_questions, unique_contexts)
+        answers = [unique_answers[i] for i in inverse]
+
+        return self._score_answers(selected, questions, answers, contexts)
+
+    async def calculate_metrics_async(
+        self,
+        model: BaseModel,
+        test_data: List[Dict[str, Any]],
+        metrics: List[str] = None,
+        max_concurrency: int = 10,
+        rpm: int = None
+    ) -> Dict[str, float]:
+        """
+        Async variant of calculate_metrics.
+
+        All model calls are issued concurrently under one adaptive
+        limiter, so wall time approaches max single-call latency times
+        ceil(N / max_concurrency) instead of N serial calls; throttling
+        errors shrink the limiter so throughput settles just under the
+        provider's rate limit. Models without a native async client run
+        through a worker thread via BaseModel.generate_response_async.
+
+        Args:
+            model: Model to evaluate
+            test_data: Test data to evaluate on
+            metrics: List of metric names to calculate (defaults to all available metrics)
+            max_concurrency: Ceiling on in-flight model calls
+            rpm: Optional requests-per-minute cap for the provider
+
+        Returns:
+            Dictionary mapping metric names to scores
+        """
+        selected = self._select_metrics(metrics)
+
+        contexts = [item["context"] for item in test_data]
+        questions = [item["question"] for item in test_data]
+
+        unique_questions, unique_contexts, inverse = self._deduplicate(
+            questions, contexts
+        )
+
+        limiter = AdaptiveLimiter(max_concurrency, rpm=rpm)
+        unique_answers = list(await asyncio.gather(*[
+            self._generate_with_retry(model, question, context, limiter)
+            for question, context in zip(unique_questions, unique_contexts)
+        ]))
+        answers = [unique_answers[i] for i in inverse]
+
+        return self._score_answers(selected, questions, answers, contexts)
+
+    @staticmethod
+    async def _generate_with_retry(
+        model: BaseModel,
+        question: str,
+        context: str,
+        limiter: AdaptiveLimiter
+    ) -> str:
+        """Generate one answer, retrying transient provider failures.
+
+        Rate limits and timeouts get exponential backoff plus jitter
+        across three attempts; throttling errors additionally halve the
+        limiter's concurrency so the remaining calls back off together.
+        """
+        delay = 1.0
+        for attempt in range(3):
+            async with limiter:
+                try:
+                    api_calls.add(1, {"op": "generate"})
+                    response = await model.generate_response_async(question, context)
+                    limiter.on_success()
+                    return response
+                except Exception as e:
+                    if is_rate_limit_error(e):
+                        limiter.on_rate_limit()
+                    if attempt == 2:
+                        raise
+                    logger.warning(
+                        "Model call failed (attempt %d/3), retrying: %s",
+                        attempt + 1, e
+                    )
+            await asyncio.sleep(delay + random.random())
+            delay *= 2
+
+    def calculate_metrics_paired(
+        self,
+        original_model: BaseModel,
+        challenger_model: BaseModel,
+        test_data: List[Dict[str, Any]],
+        metrics: List[str] = None,
+        max_concurrency: int = 10,
+        rpm: int = None
+    ):
+        """
+        Evaluate two models in a single pass over the test data.
+
+        The column extraction and (context, question) deduplication are
+        shared between the models instead of being redone per evaluation,
+        and all generations for both models run under one adaptive
+        concurrency budget. Scoring also shares the per-row score cache,
+        so rows where both models produce the same answer are judged once.
+
+        Args:
+            original_model: Model being validated
+            challenger_model: Model being compared against
+            test_data: Test data to evaluate on
+            metrics: List of metric names to calculate (defaults to all available metrics)
+            max_concurrency: Ceiling on in-flight model calls across both models
+            rpm: Optional requests-per-minute cap shared by both models
+
+        Returns:
+            Tuple of (original scores, challenger scores) dictionaries
+        """
+        selected = self._select_metrics(metrics)
+
+        contexts = [item["context"] for item in test_data]
+        questions = [item["question"] for item in test_data]
+
+        unique_questions, unique_contexts, inverse = self._deduplicate(
+            questions, contexts
+        )
+
+        async def _generate_both():
+            limiter = AdaptiveLimiter(max_concurrency, rpm=rpm)
+            pairs = list(zip(unique_questions, unique_contexts))
+            return await asyncio.gather(
+                asyncio.gather(*[
+                    self._generate_with_retry(original_model, q, c, limiter)
+                    for q, c in pairs
+                ]),
+                asyncio.gather(*[
+                    self._generate_with_retry(challenger_model, q, c, limiter)
+                    for q, c in pairs
+                ])
+            )
+
+        original_unique, challenger_unique = asyncio.run(_generate_both())
+        original_answers = [original_unique[i] for i in inverse]
+        challenger_answers = [challenger_unique[i] for i in inverse]
+
+        return (
+            self._score_answers(selected, questions, original_answers, contexts),
+            self._score_answers(selected, questions, challenger_answers, contexts)
+        )
@@ -0,0 +1,9 @@
+from .base import BaseModel
+from .azure import AzureOpenAIModel
+from .bedrock import BedrockModel
+
+__all__ = [
+    "BaseModel",
+    "AzureOpenAIModel",
+    "BedrockModel",
+]
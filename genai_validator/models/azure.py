@@ -1,35 +1,51 @@
-from typing import List, Dict, Any, Optional
-from openai import AzureOpenAI
+import asyncio
+from typing import List, Dict, Optional
+from openai import AsyncAzureOpenAI, AzureOpenAI, RateLimitError
 from .base import BaseModel
 
 class AzureOpenAIModel(BaseModel):
+    supports_async = True
+
     def __init__(
         self,
         deployment_name: str,
         api_key: str,
         api_base: str,
         api_version: str = "2024-02-15-preview",
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        max_concurrency: int = 16
     ):
         """
         Initialize Azure OpenAI model.
-        
+
         Args:
             deployment_name: Name of the deployed model
             api_key: Azure OpenAI API key
             api_base: Azure OpenAI API base URL
             api_version: API version to use
             max_tokens: Maximum tokens for generation
+            max_concurrency: Maximum concurrent requests in batch_generate
         """
         self.deployment_name = deployment_name
         self.max_tokens = max_tokens
-        
+        self.max_concurrency = max_concurrency
+
         self.client = AzureOpenAI(
             api_key=api_key,
             api_version=api_version,
             azure_endpoint=api_base
         )
+        self.async_client = AsyncAzureOpenAI(
+            api_key=api_key,
+            api_version=api_version,
+            azure_endpoint=api_base
+        )
     
+    @property
+    def fingerprint(self) -> str:
+        """Identity of the configured deployment and generation settings."""
+        return f"azure:{self.deployment_name}:max_tokens={self.max_tokens}:temperature=0.7"
+
     def _format_prompt(self, prompt: str, context: Optional[str] = None) -> List[Dict[str, str]]:
         """Format prompt as messages for chat completion."""
         messages = []
@@ -60,53 +76,54 @@ class AzureOpenAIModel(BaseModel):
         
         return response.choices[0].message.content
     
+    async def _agenerate(self, prompt: str, context: Optional[str] = None) -> str:
+        """Generate a single response through the async client.
+
+        Rate-limit errors propagate to the caller: the metrics layer owns
+        retry, backoff and adaptive concurrency for this path, and an
+        inner retry would hide 429s from its limiter.
+        """
+        messages = self._format_prompt(prompt, context)
+
+        response = await self.async_client.chat.completions.create(
+            model=self.deployment_name,
+            messages=messages,
+            max_tokens=self.max_tokens,
+            temperature=0.7
+        )
+        return response.choices[0].message.content
+
+    async def generate_response_async(self, prompt: str, context: str = None) -> str:
+        """Generate a response through the native async client."""
+        return await self._agenerate(prompt, context)
+
+    async def _batch_async(self, prompts: List[str], contexts: List[str]) -> List[str]:
+        """Issue all requests concurrently, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _with_sem(prompt, context):
+            # Direct batch_generate callers run outside the metrics
+            # layer's limiter, so throttling is retried with exponential
+            # backoff here.
+            delay = 1.0
+            async with semaphore:
+                for attempt in range(3):
+                    try:
+                        return await self._agenerate(prompt, context)
+                    except RateLimitError:
+                        if attempt == 2:
+                            raise
+                        await asyncio.sleep(delay)
+                        delay *= 2
+
+        return await asyncio.gather(*[
+            _with_sem(prompt, context)
+            for prompt, context in zip(prompts, contexts)
+        ])
+
     def batch_generate(self, prompts: List[str], contexts: List[str] = None) -> List[str]:
-        """Generate responses for multiple prompts."""
+        """Generate responses for multiple prompts concurrently."""
         if contexts is None:
             contexts = [None] * len(prompts)
-        
-        responses = []
-        for prompt, context in zip(prompts, contexts):
-            response = self.generate_response(prompt, context)
-            responses.append(response)
-        
-        return responses
-    
-    def generate_test_data(self, development_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Generate test data based on development data."""
-        test_data = []
-        
-        for item in development_data:
-            context = item.get("context", "")
-            original_question = item.get("question", "")
-            
-            # Generate new test question
-            question_prompt = (
-                "Based on the following context and original question, "
-                "generate a new, related but different question that tests "
-                "similar knowledge or understanding:\n\n"
-                f"Context: {context}\n"
-                f"Original Question: {original_question}\n\n"
-                "Generate a new question:"
-            )
-            
-            new_question = self.generate_response(question_prompt)
-            
-            # Generate ground truth answer
-            answer_prompt = (
-                f"Context: {context}\n"
-                f"Question: {new_question}\n\n"
-                "Provide a detailed and accurate answer:"
-            )
-            
-            ground_truth = self.generate_response(answer_prompt)
-            
-            test_data.append({
-                "context": context,
-                "question": new_question,
-                "ground_truth": ground_truth,
-                "original_question": original_question,
-                "original_answer": item.get("answer", "")
-            })
-        
-        return test_data 
\ No newline at end of file
+
+        return asyncio.run(self._batch_async(prompts, contexts))
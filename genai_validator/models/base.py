@@ -1,20 +1,177 @@
+import asyncio
+import json
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 
+# Prompt templates for test-data generation, shared by all providers.
+_BATCH_TEMPLATE = (
+    "For each numbered input below, generate a new, related but different "
+    "question that tests similar knowledge or understanding, and provide a "
+    "detailed and accurate answer to your new question.\n\n"
+    "{items}\n\n"
+    "Respond with only a JSON array containing one object per input, in "
+    "order, each with the keys \"question\" and \"answer\"."
+)
+_BATCH_ITEM_TEMPLATE = (
+    "{index}. Context: {context}\n"
+    "   Original Question: {question}"
+)
+_QUESTION_TEMPLATE = (
+    "Based on the following context and original question, "
+    "generate a new, related but different question that tests "
+    "similar knowledge or understanding:\n\n"
+    "Context: {context}\n"
+    "Original Question: {question}\n\n"
+    "Generate a new question:"
+)
+_ANSWER_TEMPLATE = (
+    "Context: {context}\n"
+    "Question: {question}\n\n"
+    "Provide a detailed and accurate answer:"
+)
+
 class BaseModel(ABC):
     """Base class for all models (original and challenger)."""
-    
+
+    #: Whether the model has a native async client. Models without one
+    #: still work through generate_response_async via a worker thread.
+    supports_async = False
+
+    @property
+    def fingerprint(self) -> str:
+        """Identity of the configured model.
+
+        Two model instances with equal fingerprints produce equivalent
+        responses, letting callers skip duplicate evaluation. Providers
+        should include everything that affects output (model name,
+        generation parameters) in their override. The default is unique
+        per instance, so subclasses that do not override it are never
+        treated as equivalent by accident — they only forgo the
+        deduplication and caching that fingerprints enable.
+        """
+        return f"{self.__class__.__name__}:{id(self):#x}"
+
     @abstractmethod
     def generate_response(self, prompt: str, context: str = None) -> str:
         """Generate a response for the given prompt and optional context."""
         pass
-    
-    @abstractmethod
-    def generate_test_data(self, development_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Generate test data based on development data."""
-        pass
-    
+
+    async def generate_response_async(self, prompt: str, context: str = None) -> str:
+        """Async counterpart of generate_response.
+
+        The default runs the sync implementation in a worker thread so
+        every model can participate in concurrent evaluation; providers
+        with native async clients should override this.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.generate_response, prompt, context)
+
+    @staticmethod
+    def _parse_batch_response(response: str, expected: int) -> List[Dict[str, str]]:
+        """Parse a batched test-data response into per-item dicts."""
+        text = response.strip()
+        # Models frequently wrap JSON in a markdown code fence.
+        if text.startswith("```"):
+            text = text.split("```")[1]
+            if text.startswith("json"):
+                text = text[len("json"):]
+
+        parsed = json.loads(text)
+        if (
+            not isinstance(parsed, list)
+            or len(parsed) != expected
+            or not all(isinstance(item, dict) for item in parsed)
+        ):
+            raise ValueError(
+                f"Expected a JSON array of {expected} objects, got: {text[:100]}"
+            )
+        return parsed
+
+    def _generate_test_items(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Per-item fallback: one question call and one answer call each."""
+        test_data = []
+
+        for item in batch:
+            context = item.get("context", "")
+            original_question = item.get("question", "")
+
+            new_question = self.generate_response(
+                _QUESTION_TEMPLATE.format(
+                    context=context,
+                    question=original_question
+                )
+            )
+            ground_truth = self.generate_response(
+                _ANSWER_TEMPLATE.format(
+                    context=context,
+                    question=new_question
+                )
+            )
+
+            test_data.append({
+                "context": context,
+                "question": new_question,
+                "ground_truth": ground_truth,
+                "original_question": original_question,
+                "original_answer": item.get("answer", "")
+            })
+
+        return test_data
+
+    def generate_test_data(
+        self,
+        development_data: List[Dict[str, Any]],
+        batch_size: int = 10
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate test data based on development data.
+
+        Development items are marshalled into batched prompts of
+        ``batch_size`` inputs each, cutting the API call count from 2*N
+        (question plus answer per item) to N / batch_size. The batch
+        prompts themselves go through batch_generate, so they also run
+        with the provider's concurrency. Chunks whose response cannot be
+        parsed fall back to the per-item path.
+        """
+        batches = [
+            development_data[start:start + batch_size]
+            for start in range(0, len(development_data), batch_size)
+        ]
+
+        prompts = [
+            _BATCH_TEMPLATE.format(items="\n".join(
+                _BATCH_ITEM_TEMPLATE.format(
+                    index=i + 1,
+                    context=item.get("context", ""),
+                    question=item.get("question", "")
+                )
+                for i, item in enumerate(batch)
+            ))
+            for batch in batches
+        ]
+
+        responses = self.batch_generate(prompts)
+
+        test_data = []
+        for batch, response in zip(batches, responses):
+            try:
+                parsed = self._parse_batch_response(response, len(batch))
+            except (ValueError, json.JSONDecodeError):
+                test_data.extend(self._generate_test_items(batch))
+                continue
+
+            for item, generated in zip(batch, parsed):
+                test_data.append({
+                    "context": item.get("context", ""),
+                    "question": generated.get("question", ""),
+                    "ground_truth": generated.get("answer", ""),
+                    "original_question": item.get("question", ""),
+                    "original_answer": item.get("answer", "")
+                })
+
+        return test_data
+
     @abstractmethod
     def batch_generate(self, prompts: List[str], contexts: List[str] = None) -> List[str]:
         """Generate responses for multiple prompts in batch."""
-        pass 
\ No newline at end of file
+        pass
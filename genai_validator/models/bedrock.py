@@ -1,6 +1,7 @@
-from typing import List, Dict, Any, Optional
-import boto3
+from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 from .base import BaseModel
+from .._aws import get_client, get_session
 
 class BedrockModel(BaseModel):
     def __init__(
@@ -8,101 +9,79 @@ class BedrockModel(BaseModel):
         model_id: str,
         region_name: str = "us-east-1",
         credentials: Optional[Dict[str, str]] = None,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        max_concurrency: int = 16
     ):
         """
         Initialize Bedrock model.
-        
+
         Args:
             model_id: Bedrock model ID (e.g., "anthropic.claude-v2")
             region_name: AWS region name
             credentials: AWS credentials (access key, secret key)
             max_tokens: Maximum tokens for generation
+            max_concurrency: Maximum concurrent requests in batch_generate
         """
         self.model_id = model_id
         self.max_tokens = max_tokens
-        
-        session_kwargs = {"region_name": region_name}
-        if credentials:
-            session_kwargs.update({
-                "aws_access_key_id": credentials.get("access_key"),
-                "aws_secret_access_key": credentials.get("secret_key")
-            })
-        
-        self.session = boto3.Session(**session_kwargs)
-        self.client = self.session.client("bedrock-runtime")
-        
-    def _format_prompt(self, prompt: str, context: Optional[str] = None) -> str:
-        """Format prompt based on model type."""
-        if context:
-            if "claude" in self.model_id.lower():
-                return f"Context: {context}\n\nHuman: {prompt}\n\nAssistant:"
-            else:
-                return f"Context: {context}\nQuestion: {prompt}"
-        return prompt
-    
+        self.max_concurrency = max_concurrency
+
+        # Request pieces that never vary per call are bound once here
+        # (partial evaluation on invariant state) instead of being rebuilt
+        # on every request.
+        self._inference_config = {
+            "maxTokens": max_tokens,
+            "temperature": 0.7
+        }
+        self._system_template = (
+            "Use the following context to answer the question: {}"
+        ).format
+
+        credentials = credentials or {}
+        self.session = get_session(
+            region_name,
+            credentials.get("access_key"),
+            credentials.get("secret_key")
+        )
+        # The shared factory sizes the connection pool for concurrent
+        # requests and lets botocore back off adaptively when throttled.
+        self.client = get_client(
+            "bedrock-runtime",
+            region_name,
+            credentials.get("access_key"),
+            credentials.get("secret_key")
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """Identity of the configured model and generation settings."""
+        return f"bedrock:{self.model_id}:max_tokens={self.max_tokens}:temperature=0.7"
+
     def generate_response(self, prompt: str, context: str = None) -> str:
-        """Generate a response using the Bedrock model."""
-        formatted_prompt = self._format_prompt(prompt, context)
-        
-        response = self.client.invoke_model(
+        """Generate a response using the Bedrock Converse API."""
+        # Converse handles per-model prompt templating, so there is no
+        # model-family formatting branch here.
+        response = self.client.converse(
             modelId=self.model_id,
-            body={
-                "prompt": formatted_prompt,
-                "max_tokens_to_sample": self.max_tokens,
-                "temperature": 0.7
-            }
+            messages=[{
+                "role": "user",
+                "content": [{"text": prompt}]
+            }],
+            system=(
+                [{"text": self._system_template(context)}]
+                if context else []
+            ),
+            inferenceConfig=self._inference_config
         )
-        
-        return response["body"]["completion"]
-    
+
+        return response["output"]["message"]["content"][0]["text"]
+
     def batch_generate(self, prompts: List[str], contexts: List[str] = None) -> List[str]:
-        """Generate responses for multiple prompts."""
+        """Generate responses for multiple prompts concurrently."""
         if contexts is None:
             contexts = [None] * len(prompts)
-        
-        responses = []
-        for prompt, context in zip(prompts, contexts):
-            response = self.generate_response(prompt, context)
-            responses.append(response)
-        
-        return responses
-    
-    def generate_test_data(self, development_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Generate test data based on development data."""
-        test_data = []
-        
-        for item in development_data:
-            # Create a prompt for generating test questions/scenarios
-            context = item.get("context", "")
-            original_question = item.get("question", "")
-            
-            prompt = (
-                f"Based on the following context and original question, "
-                f"generate a new, related but different question that tests "
-                f"similar knowledge or understanding:\n\n"
-                f"Context: {context}\n"
-                f"Original Question: {original_question}\n\n"
-                f"Generate a new question:"
-            )
-            
-            new_question = self.generate_response(prompt)
-            
-            # Generate ground truth answer
-            answer_prompt = (
-                f"Context: {context}\n"
-                f"Question: {new_question}\n\n"
-                f"Provide a detailed and accurate answer:"
-            )
-            
-            ground_truth = self.generate_response(answer_prompt)
-            
-            test_data.append({
-                "context": context,
-                "question": new_question,
-                "ground_truth": ground_truth,
-                "original_question": original_question,
-                "original_answer": item.get("answer", "")
-            })
-        
-        return test_data 
\ No newline at end of file
+
+        # Bedrock has no batch endpoint but tolerates high per-account
+        # concurrency, so fan the converse calls out across threads.
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            return list(executor.map(self.generate_response, prompts, contexts))
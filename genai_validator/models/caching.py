@@ -0,0 +1,128 @@
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+import hashlib
+from .base import BaseModel
+from .._telemetry import cache_hits, cache_misses
+
+class CachingModel(BaseModel):
+    """
+    Wrap a model with an exact-match response cache.
+
+    Evaluation loops repeatedly issue identical (prompt, context) pairs —
+    e.g. when the same test data is scored with several metrics or across
+    validation runs — and every repeat is a full remote API call. The
+    cache is keyed by a hash of the prompt and context and evicts
+    least-recently-used entries beyond ``maxsize``.
+    """
+
+    def __init__(self, model: BaseModel, maxsize: int = 4096):
+        """
+        Initialize the caching wrapper.
+
+        Args:
+            model: Model whose responses should be cached
+            maxsize: Maximum number of cached responses
+        """
+        self.model = model
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    def _cache_key(prompt: str, context: Optional[str]) -> str:
+        payload = (context or "") + "\x1f" + prompt
+        return hashlib.blake2b(payload.encode("utf-8")).hexdigest()
+
+    def _cache_set(self, key: str, response: str) -> None:
+        self._cache[key] = response
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    @property
+    def supports_async(self):
+        return self.model.supports_async
+
+    @property
+    def fingerprint(self) -> str:
+        return self.model.fingerprint
+
+    def generate_response(self, prompt: str, context: str = None) -> str:
+        """Generate a response, serving repeats from the cache."""
+        key = self._cache_key(prompt, context)
+
+        if key in self._cache:
+            cache_hits.add(1, {"cache": "response"})
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        cache_misses.add(1, {"cache": "response"})
+        response = self.model.generate_response(prompt, context)
+        self._cache_set(key, response)
+        return response
+
+    async def generate_response_async(self, prompt: str, context: str = None) -> str:
+        """Async variant of generate_response with the same cache."""
+        key = self._cache_key(prompt, context)
+
+        if key in self._cache:
+            cache_hits.add(1, {"cache": "response"})
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        cache_misses.add(1, {"cache": "response"})
+        response = await self.model.generate_response_async(prompt, context)
+        self._cache_set(key, response)
+        return response
+
+    def batch_generate(self, prompts: List[str], contexts: List[str] = None) -> List[str]:
+        """Generate responses in batch, only calling the model for misses."""
+        if contexts is None:
+            contexts = [None] * len(prompts)
+
+        keys = [
+            self._cache_key(prompt, context)
+            for prompt, context in zip(prompts, contexts)
+        ]
+
+        # Answer positions from the responses list rather than by reading
+        # the cache back: the cache is write-behind only, so a batch with
+        # more unique misses than maxsize still returns every response
+        # even after the earliest entries were evicted.
+        responses: List[Optional[str]] = [None] * len(keys)
+        miss_indices = []
+        pending: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                responses[i] = self._cache[key]
+            elif key in pending:
+                # Duplicate within the batch: share the first fetch
+                # instead of asking the model again.
+                pending[key].append(i)
+            else:
+                pending[key] = [i]
+                miss_indices.append(i)
+
+        cache_hits.add(len(keys) - len(miss_indices), {"cache": "response"})
+        cache_misses.add(len(miss_indices), {"cache": "response"})
+
+        if miss_indices:
+            # Delegate misses as one batch so the wrapped model keeps its
+            # own concurrency behavior.
+            miss_responses = self.model.batch_generate(
+                [prompts[i] for i in miss_indices],
+                [contexts[i] for i in miss_indices]
+            )
+            for i, response in zip(miss_indices, miss_responses):
+                for position in pending[keys[i]]:
+                    responses[position] = response
+                self._cache_set(keys[i], response)
+
+        return responses
+
+    def generate_test_data(
+        self,
+        development_data: List[Dict[str, Any]],
+        batch_size: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Generate test data with the wrapped model."""
+        return self.model.generate_test_data(development_data, batch_size=batch_size)
@@ -1,57 +1,247 @@
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
-import ragas
-from ragas.metrics import (
-    answer_relevancy,
-    context_relevancy,
-    faithfulness,
-    context_recall
-)
+import numpy as np
 from .models.base import BaseModel as GenAIModel
+from .models.caching import CachingModel
 from .metrics import MetricsCalculator
 from .challenger import ChallengerSelector
+from ._telemetry import api_latency
+
+try:
+    import orjson
+
+    def _canonical_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+    def _json_dumps(obj) -> bytes:
+        # orjson serializes float-heavy dicts several times faster than
+        # stdlib json and handles numpy scalars natively.
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _canonical_dumps(obj) -> bytes:
+        return json.dumps(obj, sort_keys=True).encode("utf-8")
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+logger = logging.getLogger(__name__)
+
+# Report line templates, pre-bound so the constant format specs are
+# parsed once instead of per metric inside the report loops.
+_METRIC_LINE = "- {}: {:.4f}".format
+_DIFF_LINE = "- Difference: {:.4f}".format
+_REL_LINE = "- Relative Improvement: {:.2%}".format
+
+# Default location for cached challenger-generated test data.
+TEST_DATA_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "genai_validator", "testdata"
+)
+
+@functools.lru_cache(maxsize=None)
+def _select_challenger(task_type: str) -> GenAIModel:
+    """Select the best challenger for a task once per process.
+
+    Selection builds a provider client (and may grow benchmark probes),
+    so validators sharing a task type reuse one selected model instead of
+    repeating that work per instance.
+    """
+    return ChallengerSelector(task_type=task_type).get_best_model()
+
+class ComparisonTable:
+    """Struct-of-arrays comparison of two models' metric scores.
+
+    One list of metric names plus two parallel float64 arrays instead of
+    a dict of two-key dicts per metric: far less per-entry overhead when
+    metrics fan out (per-sample or per-slice breakdowns), and downstream
+    consumers can work on whole columns vectorized. Mapping-style access
+    (``table["faithfulness"]["difference"]``) is kept for compatibility.
+    """
+
+    __slots__ = ("metric_names", "difference", "relative_improvement", "_index")
+
+    def __init__(self, metric_names, difference, relative_improvement):
+        self.metric_names = list(metric_names)
+        self.difference = np.asarray(difference, dtype=np.float64)
+        self.relative_improvement = np.asarray(
+            relative_improvement, dtype=np.float64
+        )
+        self._index = {name: i for i, name in enumerate(self.metric_names)}
+
+    def __len__(self) -> int:
+        return len(self.metric_names)
+
+    def __iter__(self):
+        return iter(self.metric_names)
+
+    def __contains__(self, name) -> bool:
+        return name in self._index
+
+    def __getitem__(self, name: str) -> Dict[str, float]:
+        """Return one metric's comparison as a plain dictionary."""
+        i = self._index[name]
+        return {
+            "difference": float(self.difference[i]),
+            "relative_improvement": float(self.relative_improvement[i])
+        }
+
+    def items(self):
+        """Yield (metric name, comparison dict) pairs in metric order."""
+        for name in self.metric_names:
+            yield name, self[name]
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        """Return the table as the nested-dict layout it replaced."""
+        return dict(self.items())
+
+@dataclass
+class ValidationResults:
+    """Evaluation results for one validation run.
+
+    A slotted dataclass rather than a pydantic model: the fields are
+    built and typed inside validate, so re-validating them on
+    construction would only add overhead on the output path.
+    """
+    __slots__ = ("original_metrics", "challenger_metrics", "comparison_metrics")
 
-class ValidationResults(BaseModel):
     original_metrics: Dict[str, float]
     challenger_metrics: Dict[str, float]
-    comparison_metrics: Dict[str, Dict[str, float]]
-    
-    def generate_report(self) -> str:
-        """Generate a formatted report comparing the metrics."""
-        report = ["# Model Validation Report\n"]
-        
-        report.append("## Original Model Metrics")
+    comparison_metrics: ComparisonTable
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the results as a plain dictionary."""
+        return {
+            "original_metrics": dict(self.original_metrics),
+            "challenger_metrics": dict(self.challenger_metrics),
+            "comparison_metrics": self.comparison_metrics.to_dict()
+        }
+
+    def to_json(self) -> bytes:
+        """Serialize the results to JSON bytes."""
+        return _json_dumps(self.to_dict())
+
+    def _report_lines(self):
+        """Yield report lines one at a time.
+
+        Feeding a generator straight into "\\n".join avoids growing and
+        reallocating an intermediate list when the metric dicts are large.
+        """
+        yield "# Model Validation Report\n"
+
+        yield "## Original Model Metrics"
         for metric, value in self.original_metrics.items():
-            report.append(f"- {metric}: {value:.4f}")
-            
-        report.append("\n## Challenger Model Metrics")
+            yield _METRIC_LINE(metric, value)
+
+        yield "\n## Challenger Model Metrics"
         for metric, value in self.challenger_metrics.items():
-            report.append(f"- {metric}: {value:.4f}")
-            
-        report.append("\n## Comparison Analysis")
-        for metric, comparison in self.comparison_metrics.items():
-            report.append(f"\n### {metric}")
-            report.append(f"- Difference: {comparison['difference']:.4f}")
-            report.append(f"- Relative Improvement: {comparison['relative_improvement']:.2%}")
-            
-        return "\n".join(report)
+            yield _METRIC_LINE(metric, value)
+
+        yield "\n## Comparison Analysis"
+        table = self.comparison_metrics
+        for i, metric in enumerate(table.metric_names):
+            yield f"\n### {metric}"
+            yield _DIFF_LINE(table.difference[i])
+            yield _REL_LINE(table.relative_improvement[i])
+
+    def generate_report(self) -> str:
+        """Generate a formatted report comparing the metrics."""
+        return "\n".join(self._report_lines())
 
 class ModelValidator:
     def __init__(
         self,
         original_model: GenAIModel,
         challenger_model: Optional[GenAIModel] = None,
-        task_type: str = "qa"
+        task_type: str = "qa",
+        cache_responses: bool = True,
+        batch_size: int = 10,
+        max_concurrency: int = 10,
+        rpm: Optional[int] = None,
+        cache_backend=None,
+        test_data_cache_dir: Optional[str] = TEST_DATA_CACHE_DIR
     ):
         self.original_model = original_model
-        self.challenger_model = challenger_model
         self.task_type = task_type
-        self.metrics_calculator = MetricsCalculator()
-        
-        if challenger_model is None:
-            self.challenger_selector = ChallengerSelector(task_type=task_type)
-            self.challenger_model = self.challenger_selector.get_best_model()
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.rpm = rpm
+        self.test_data_cache_dir = test_data_cache_dir
+        self.metrics_calculator = MetricsCalculator(cache_backend=cache_backend)
+        self._cache_responses = cache_responses
+        self._challenger_model = challenger_model
+
+        # Evaluation loops re-issue identical (prompt, context) pairs;
+        # caching turns those repeats into dictionary lookups. Challenger
+        # selection itself is deferred to the challenger_model property.
+        if cache_responses:
+            self.original_model = CachingModel(self.original_model)
+            if challenger_model is not None:
+                self._challenger_model = CachingModel(challenger_model)
+
+    @property
+    def challenger_model(self) -> GenAIModel:
+        """The challenger model, selected lazily on first access.
+
+        Callers that never validate — e.g. those only rendering prior
+        ValidationResults — skip challenger selection and its client
+        construction entirely.
+        """
+        if self._challenger_model is None:
+            model = _select_challenger(self.task_type)
+            if self._cache_responses:
+                model = CachingModel(model)
+            self._challenger_model = model
+        return self._challenger_model
     
+    def _load_or_generate_test_data(
+        self,
+        development_data: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Return challenger-generated test data, cached on disk by content.
+
+        The cache key hashes the development data together with the
+        challenger fingerprint, so hyperparameter sweeps and metric
+        ablations over unchanged data skip every challenger LLM call.
+        """
+        if self.test_data_cache_dir is None:
+            return self.challenger_model.generate_test_data(
+                development_data,
+                batch_size=self.batch_size
+            )
+
+        digest = hashlib.sha256(
+            _canonical_dumps(development_data)
+            + b"|"
+            + self.challenger_model.fingerprint.encode("utf-8")
+        ).hexdigest()
+        cache_path = os.path.join(self.test_data_cache_dir, f"{digest}.json")
+
+        if os.path.exists(cache_path):
+            logger.debug("Reusing cached test data from %s", cache_path)
+            with open(cache_path, "rb") as f:
+                return json.loads(f.read())
+
+        test_data = self.challenger_model.generate_test_data(
+            development_data,
+            batch_size=self.batch_size
+        )
+
+        os.makedirs(self.test_data_cache_dir, exist_ok=True)
+        # Write-then-rename keeps concurrent validators from reading a
+        # partially written cache entry.
+        tmp_path = f"{cache_path}.tmp.{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            f.write(_canonical_dumps(test_data))
+        os.replace(tmp_path, cache_path)
+
+        return test_data
+
     def validate(
         self,
         development_data: List[Dict[str, Any]],
@@ -70,35 +260,73 @@ class ModelValidator:
         if metrics is None:
             metrics = ["faithfulness", "context_utilization", "answer_relevancy"]
             
-        # Generate test data using challenger model
-        test_data = self.challenger_model.generate_test_data(development_data)
-        
-        # Evaluate original model
-        original_results = self.metrics_calculator.calculate_metrics(
-            model=self.original_model,
-            test_data=test_data,
-            metrics=metrics
+        # Generate test data using challenger model, reusing a cached copy
+        # when the same development data was already processed.
+        start = time.perf_counter()
+        test_data = self._load_or_generate_test_data(development_data)
+        api_latency.record(
+            (time.perf_counter() - start) * 1000,
+            {"op": "generate_test_data", "model": self.challenger_model.fingerprint}
         )
-        
-        # Evaluate challenger model
-        challenger_results = self.metrics_calculator.calculate_metrics(
-            model=self.challenger_model,
-            test_data=test_data,
-            metrics=metrics
+
+        start = time.perf_counter()
+        if (self.challenger_model is self.original_model
+                or self.challenger_model.fingerprint == self.original_model.fingerprint):
+            # Identically configured models produce the same metrics; skip
+            # the duplicate pass instead of repeating every LLM call.
+            original_results = asyncio.run(
+                self.metrics_calculator.calculate_metrics_async(
+                    model=self.original_model,
+                    test_data=test_data,
+                    metrics=metrics,
+                    max_concurrency=self.max_concurrency,
+                    rpm=self.rpm
+                )
+            )
+            challenger_results = dict(original_results)
+        else:
+            # The paired pass shares the column extraction, deduplication
+            # and score cache between the two models and runs all of their
+            # generations concurrently in one event loop.
+            original_results, challenger_results = (
+                self.metrics_calculator.calculate_metrics_paired(
+                    original_model=self.original_model,
+                    challenger_model=self.challenger_model,
+                    test_data=test_data,
+                    metrics=metrics,
+                    max_concurrency=self.max_concurrency,
+                    rpm=self.rpm
+                )
+            )
+        api_latency.record(
+            (time.perf_counter() - start) * 1000,
+            {"op": "evaluate", "model": self.original_model.fingerprint}
         )
-        
-        # Compare results
-        comparison_metrics = {}
-        for metric in metrics:
-            orig_value = original_results[metric]
-            chall_value = challenger_results[metric]
-            comparison_metrics[metric] = {
-                "difference": chall_value - orig_value,
-                "relative_improvement": (chall_value - orig_value) / orig_value
-            }
-        
+
+        # Compare results vectorized over the metric axis; a zero original
+        # score yields NaN instead of raising ZeroDivisionError.
+        original_values = np.fromiter(
+            (original_results[metric] for metric in metrics),
+            dtype=np.float64,
+            count=len(metrics)
+        )
+        challenger_values = np.fromiter(
+            (challenger_results[metric] for metric in metrics),
+            dtype=np.float64,
+            count=len(metrics)
+        )
+        difference = challenger_values - original_values
+        relative_improvement = np.divide(
+            difference,
+            original_values,
+            out=np.full_like(difference, np.nan),
+            where=original_values != 0
+        )
+
         return ValidationResults(
             original_metrics=original_results,
             challenger_metrics=challenger_results,
-            comparison_metrics=comparison_metrics
+            comparison_metrics=ComparisonTable(
+                metrics, difference, relative_improvement
+            )
         ) 
\ No newline at end of file
@@ -15,6 +15,7 @@ setup(
         "pytest>=7.0.0",
         "pydantic>=2.0.0",
         "click>=8.0.0",
+        "orjson>=3.0.0",
     ],
     entry_points={
         'console_scripts': [